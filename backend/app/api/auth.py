@@ -18,10 +18,10 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 async def register(
     user: RegisterUserRequest, session: AsyncSession = Depends(get_session)
 ):
-    # Check if user exists
-    statement = select(User).where(User.username == user.username)
+    # Check if user exists (only the ID is needed, so skip loading relationships)
+    statement = select(User.id).where(User.username == user.username)
     result = await session.exec(statement)
-    if result.first():
+    if result.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
@@ -44,8 +44,10 @@ async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: AsyncSession = Depends(get_session),
 ):
-    # Simple login logic
-    statement = select(User).where(User.username == form_data.username)
+    # Simple login logic (select only the columns needed to verify credentials)
+    statement = select(User.username, User.hashed_password).where(
+        User.username == form_data.username
+    )
     result = await session.exec(statement)
     user = result.one_or_none()
 
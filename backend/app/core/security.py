@@ -1,3 +1,4 @@
+import functools
 import jwt
 
 from datetime import datetime, timedelta, timezone
@@ -31,6 +32,12 @@ def create_access_token(data: dict, expires_delta: timedelta):
     return jwt.encode(to_encode, settings().SECRET_KEY, algorithm=settings().ALGORITHM)
 
 
+@functools.lru_cache(maxsize=10_000)
+def _decode_access_token(token: str) -> dict:
+    """Decode and verify a JWT, caching the payload by raw token string."""
+    return jwt.decode(token, settings().SECRET_KEY, algorithms=[settings().ALGORITHM])
+
+
 async def get_current_user(
     token: str = Depends(oauth2scheme),
     session: AsyncSession = Depends(get_session),
@@ -42,9 +49,11 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token, settings().SECRET_KEY, algorithms=[settings().ALGORITHM]
-        )
+        payload = _decode_access_token(token)
+        # Cached payloads skip PyJWT's expiry check, so re-check it here
+        expire = payload.get("exp")
+        if expire is not None and expire <= datetime.now(timezone.utc).timestamp():
+            raise credentials_exception
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -78,7 +78,6 @@ class GameImporter:
         # Extract and Upsert Genres/Platforms
         all_genres = {}
         all_platforms = {}
-        print(raw_games)
         for g in raw_games:
             for gen in g.get("genres", []):
                 all_genres[gen["id"]] = gen
@@ -1,7 +1,6 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from app.models import Review
-from typing import Sequence
 import pandas as pd
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -11,13 +10,14 @@ class GameRecommendation:
         self.session = session
 
     async def _fetch_data(self):
-        stmt = select(Review)
+        # Only the rating triples are needed, so skip loading full Review rows
+        # (and their eagerly loaded relationships)
+        stmt = select(Review.user_id, Review.game_id, Review.rating)
         result = await self.session.exec(stmt)
-        reviews: Sequence[Review] = result.all()
 
         data = [
             {"user_id": r.user_id, "game_id": r.game_id, "rating": r.rating}
-            for r in reviews
+            for r in result.all()
         ]
         return pd.DataFrame(data)
 
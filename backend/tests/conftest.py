@@ -1,19 +1,39 @@
+import asyncio
+import os
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import AsyncGenerator, Generator, Optional
 
+from fastapi import status
 from pydantic import EmailStr
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    create_async_engine,
+    async_sessionmaker,
+)
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from httpx import AsyncClient, ASGITransport
-from fastapi import status
 from app.main import app
 from app.db.session import get_session
 from app.models import User, Follow, Game, Review, Like, Comment
-from app.core.security import hash_password
+from app.core.security import create_access_token, hash_password
 from app.common_types import FollowStatus
 
+TEST_USERNAME = "test_user"
+TEST_PASSWORD = "password123"
+TRANSACTION_STATEMENTS = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
 
 class DummySettings:
     DATABASE_URL: str = "hereismydatabase"
@@ -24,10 +44,33 @@ class DummySettings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
 
-@pytest.fixture(scope="function", autouse=True)
-def settings(monkeypatch):
+@pytest.fixture(scope="session", autouse=True)
+def settings():
     """Set up the test settings."""
-    monkeypatch.setattr("app.core.config.Settings", DummySettings)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core.config.Settings", DummySettings)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hash():
+    """Use minimal Argon2 cost parameters so hashing test passwords is cheap."""
+    # Set PYTEST_FAST_HASH=0 to run with the app's real hashing parameters
+    if os.getenv("PYTEST_FAST_HASH", "1") == "0":
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.core.security.password_hash",
+            PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),)),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def test_password_hash(fast_password_hash) -> str:
+    """Hash the shared test password once rather than on every user creation."""
+    return hash_password(TEST_PASSWORD)
 
 
 @pytest.fixture(scope="session")
@@ -35,118 +78,250 @@ def anyio_backend():
     return "asyncio"
 
 
-@pytest.fixture
-def test_engine():
-    """Create an in-memory SQLite database engine for testing."""
-    # Use in-memory SQLite database
+def create_sqlite_engine() -> AsyncEngine:
+    """Create an in-memory SQLite database engine on a single shared connection."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with (aio)sqlite
+        dbapi_connection.isolation_level = None
+        # Keep journal and temp storage in RAM and skip syncs
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     return engine
 
 
-@pytest_asyncio.fixture
-async def setup_database(test_engine):
-    """Set up the database schema."""
-    async with test_engine.begin() as conn:
+@pytest_asyncio.fixture(scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the database engine shared by the test session."""
+    # Optionally run against an empty, dedicated test database (e.g. a
+    # long-lived PostgreSQL) instead of in-memory SQLite
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if database_url:
+        engine = create_async_engine(database_url)
+    else:
+        engine = create_sqlite_engine()
+
+    # Create the schema once for the whole session (existing tables are kept)
+    async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-    yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-    await test_engine.dispose()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection whose transaction spans the whole test session."""
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture
+async def test_savepoint(
+    test_connection: AsyncConnection,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """Wrap each test in a SAVEPOINT that is rolled back on teardown."""
+    savepoint = await test_connection.begin_nested()
+    yield test_connection
+    await savepoint.rollback()
 
 
 @pytest.fixture
-def session_maker(test_engine):
+def session_maker(test_savepoint):
     """Create a session maker for the test database."""
+    # Session commits only release a nested SAVEPOINT inside the test's SAVEPOINT
     return async_sessionmaker(
-        bind=test_engine,
+        bind=test_savepoint,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
 
 @pytest_asyncio.fixture
-async def test_session(
-    session_maker, setup_database
-) -> AsyncGenerator[AsyncSession, None]:
+async def test_session(session_maker) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session."""
     async with session_maker() as session:
         yield session
 
 
-@pytest_asyncio.fixture
-async def client(setup_database, session_maker) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client that uses the test database."""
+@contextmanager
+def count_queries() -> Generator[list[str], None, None]:
+    """Record the SQL queries executed on any engine within the block."""
+    queries: list[str] = []
 
-    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-        async with session_maker() as session:
-            yield session
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        # Transaction control (BEGIN/SAVEPOINT/RELEASE/ROLLBACK) is not a query
+        if not statement.lstrip().upper().startswith(TRANSACTION_STATEMENTS):
+            queries.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    """Fail tests marked max_queries(n) whose body runs more than n queries."""
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        return (yield)
+
+    # Only the test body is counted, not the fixtures that seed its data
+    with count_queries() as queries:
+        result = yield
+    max_queries = marker.args[0]
+    if len(queries) > max_queries:
+        pytest.fail(
+            f"Expected at most {max_queries} queries, got {len(queries)}:\n"
+            + "\n".join(queries)
+        )
+    return result
 
-    # Override the get_session dependency
-    app.dependency_overrides[get_session] = override_get_session
 
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create a single async test client shared by the whole test session."""
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test", follow_redirects=True
     ) as test_client:
+        # Warm up the lazily built middleware stack with a request that skips the DB
+        await test_client.get("/health")
         yield test_client
 
-    # Clear overrides
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+def client(
+    http_client: AsyncClient, session_maker
+) -> Generator[AsyncClient, None, None]:
+    """Provide the shared test client wired up to the test database."""
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
+        async with session_maker() as session:
+            yield session
+
+    # Override the get_session dependency
+    app.dependency_overrides[get_session] = override_get_session
+
+    headers = http_client.headers.copy()
+    try:
+        yield http_client
+    finally:
+        # Undo any per-test header or cookie changes on the shared client
+        http_client.headers = headers
+        http_client.cookies.clear()
+        # Clear overrides
+        app.dependency_overrides.clear()
 
 
 @pytest_asyncio.fixture
 async def test_user(user_factory) -> User:
     """Create a test user in the database."""
-    return await user_factory(username="test_user", password="password123")
+    return await user_factory(username=TEST_USERNAME, password=TEST_PASSWORD)
 
 
-@pytest_asyncio.fixture
-async def auth_token(client: AsyncClient, test_user: User) -> str:
-    """Get an authentication token for the test user."""
-    response = await client.post(
-        "/auth/login",
-        data={
-            "username": test_user.username,
-            "password": "password123",
-            "email": test_user.email,
-            "private": test_user.private,
-        },
+@pytest.fixture(scope="session")
+def auth_token(settings) -> str:
+    """Create an authentication token for the test user once per session."""
+    # The test user is recreated under the same username in every test, so one
+    # token is valid for all of them. It must outlive the whole run (expiry is
+    # re-checked on every request), so it does not use the 30 minute setting
+    return create_access_token(
+        data={"sub": TEST_USERNAME}, expires_delta=timedelta(days=1)
     )
-    assert response.status_code == status.HTTP_200_OK
-    return response.json()["access_token"]
 
 
 @pytest_asyncio.fixture
-async def authenticated_client(client: AsyncClient, auth_token: str) -> AsyncClient:
+async def authenticated_client(
+    client: AsyncClient, test_user: User, auth_token: str
+) -> AsyncClient:
     """Create a client with authentication headers."""
-    client.headers = {
-        **client.headers,
-        "Authorization": f"Bearer {auth_token}",
-    }
+    # The client fixture restores the shared client's headers after the test
+    client.headers["Authorization"] = f"Bearer {auth_token}"
     return client
 
 
 @pytest.fixture
-def user_factory(test_session: AsyncSession):
+def logged_in_user_factory(client: AsyncClient):
+    """Factory to register users through the API and log them in."""
+
+    async def _create_logged_in_user(
+        username: str, password: str, email: EmailStr, private: bool = False
+    ) -> str:
+        response = await client.post(
+            "/auth/register",
+            json={
+                "username": username,
+                "password": password,
+                "email": email,
+                "private": private,
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.post(
+            "/auth/login", data={"username": username, "password": password}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()["access_token"]
+
+    return _create_logged_in_user
+
+
+@pytest.fixture
+def make_user(test_password_hash: str):
+    """Factory to build unsaved test users, e.g. for bulk_seed."""
+
+    def _make_user(
+        username: str, email: Optional[EmailStr] = None, private: bool = True
+    ) -> User:
+        return User(
+            username=username,
+            hashed_password=test_password_hash,
+            # Derive a unique address so callers only pass one when it matters
+            email=email or f"{username}@example.com",
+            private=private,
+        )
+
+    return _make_user
+
+
+@pytest.fixture
+def user_factory(make_user, bulk_seed):
     """Factory to create multiple test users."""
 
     async def _create_user(
         username: str,
         password: str,
-        email: EmailStr = "joe.cool@aol.com",
+        email: Optional[EmailStr] = None,
         private: bool = True,
     ) -> User:
-        user = User(
-            username=username,
-            hashed_password=hash_password(password),
-            email=email,
-            private=private,
-        )
-        test_session.add(user)
-        await test_session.commit()
-        await test_session.refresh(user)
+        user = make_user(username, email, private)
+        # Hash off the event loop unless the precomputed hash can be reused
+        if password != TEST_PASSWORD:
+            user.hashed_password = await asyncio.to_thread(hash_password, password)
+        # The commit's flush assigns the ID and expire_on_commit=False keeps the
+        # loaded attributes, so no follow-up refresh SELECT is needed
+        await bulk_seed(user)
         return user
 
     return _create_user
@@ -164,12 +339,28 @@ def follow_request_factory(test_session: AsyncSession):
         )
         test_session.add(follow_request)
         await test_session.commit()
-        await test_session.refresh(follow_request)
         return follow_request
 
     return _create_follow_request
 
 
+@pytest.fixture
+def follower_factory(make_user, bulk_seed):
+    """Factory to create a second user who follows the given user."""
+
+    async def _create_follower(
+        followed: User, status: FollowStatus = FollowStatus.PENDING
+    ) -> User:
+        follower = make_user("user2", "cool.otter@aol.com")
+        # Link the follow through the relationship so both rows share one commit
+        await bulk_seed(
+            follower, Follow(follower=follower, followed_id=followed.id, status=status)
+        )
+        return follower
+
+    return _create_follower
+
+
 @pytest.fixture
 def game_factory(test_session: AsyncSession):
     """Factory to create test games."""
@@ -182,12 +373,38 @@ def game_factory(test_session: AsyncSession):
         )
         test_session.add(game)
         await test_session.commit()
-        await test_session.refresh(game)
         return game
 
     return _create_game
 
 
+@pytest.fixture
+def bulk_seed(test_session: AsyncSession):
+    """Factory to insert several related rows with a single commit."""
+
+    async def _seed(*rows: SQLModel) -> None:
+        # Rows linked through relationships are inserted in dependency order
+        test_session.add_all(rows)
+        await test_session.commit()
+
+    return _seed
+
+
+@pytest.fixture
+def games_factory_bulk(bulk_seed):
+    """Factory to create several test games with a single commit."""
+
+    async def _create_games(specs: list[tuple[str, str, int]]) -> list[Game]:
+        games = [
+            Game(title=title, summary=summary, igdb_id=igdb_id)
+            for title, summary, igdb_id in specs
+        ]
+        await bulk_seed(*games)
+        return games
+
+    return _create_games
+
+
 @pytest.fixture
 def review_factory(test_session: AsyncSession):
     """Factory to create test reviews."""
@@ -208,7 +425,6 @@ def review_factory(test_session: AsyncSession):
         )
         test_session.add(review)
         await test_session.commit()
-        await test_session.refresh(review)
         return review
 
     return _create_review
@@ -225,7 +441,6 @@ def like_factory(test_session: AsyncSession):
         )
         test_session.add(like)
         await test_session.commit()
-        await test_session.refresh(like)
         return like
 
     return _create_like
@@ -246,7 +461,64 @@ def comment_factory(test_session: AsyncSession):
         )
         test_session.add(comment)
         await test_session.commit()
-        await test_session.refresh(comment)
         return comment
 
     return _create_comment
+
+
+@pytest.fixture
+def factories(
+    user_factory,
+    game_factory,
+    review_factory,
+    like_factory,
+    comment_factory,
+    follow_request_factory,
+) -> SimpleNamespace:
+    """Bundle the model factories for tests that seed several kinds of rows."""
+    return SimpleNamespace(
+        user=user_factory,
+        game=game_factory,
+        review=review_factory,
+        like=like_factory,
+        comment=comment_factory,
+        follow=follow_request_factory,
+    )
+
+
+@dataclass
+class SeededReview:
+    """A review by a second user whom the test user follows."""
+
+    user2: User
+    game: Game
+    review: Review
+    follow: Follow
+
+
+@pytest_asyncio.fixture
+async def seeded_review(
+    test_session: AsyncSession, test_user: User, make_user
+) -> SeededReview:
+    """Create the common user/game/review/follow setup with a single commit."""
+    user2 = make_user("user2", "cool.otter@aol.com")
+    game = Game(title="Test Game", summary="A test game summary", igdb_id=12345)
+    test_session.add_all([user2, game])
+    # Flush to assign the IDs the review and follow rows reference
+    await test_session.flush()
+
+    review = Review(
+        game_id=game.id,
+        user_id=user2.id,
+        rating=9.6,
+        review_text="Cool game",
+        playtime=120,
+    )
+    follow = Follow(
+        follower_id=test_user.id,
+        followed_id=user2.id,
+        status=FollowStatus.ACCEPTED,
+    )
+    test_session.add_all([review, follow])
+    await test_session.commit()
+    return SeededReview(user2=user2, game=game, review=review, follow=follow)
@@ -1,7 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from fastapi import status
-from app.models import User, FeedItemResponse
+from app.models import User, Follow, Game, Review, FeedItemResponse
 from app.common_types import FollowStatus
 
 
@@ -21,35 +21,30 @@ class TestFeedEndpoints:
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        like_factory,
-        comment_factory,
-        follow_request_factory,
+        factories,
     ):
         """Test getting feed with reviews from followed users."""
         # Create another user and follow them
-        followed_user = await user_factory(
+        followed_user = await factories.user(
             "followed_guy", "pass123", "cool.otter@aol.com"
         )
-        await follow_request_factory(
+        await factories.follow(
             follower_user_id=test_user.id,
             followed_user_id=followed_user.id,
             status=FollowStatus.ACCEPTED,
         )
 
         # Create a game and a review from that followed user
-        game = await game_factory("Elden Ring", "GOTY", 123)
-        review = await review_factory(
+        game = await factories.game("Elden Ring", "GOTY", 123)
+        review = await factories.review(
             game.id,
             followed_user.id,
             rating=10,
             review_text="Masterpiece",
             playtime=100,
         )
-        await like_factory(review.id, test_user.id)
-        await comment_factory(review.id, test_user.id, "Praise the sun!", None)
+        await factories.like(review.id, test_user.id)
+        await factories.comment(review.id, test_user.id, "Praise the sun!", None)
 
         response = await authenticated_client.get("/feed/")
 
@@ -67,38 +62,40 @@ class TestFeedEndpoints:
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        follow_request_factory,
+        make_user,
+        bulk_seed,
     ):
         """Test that limit and skip parameters work for the feed."""
-        followed_user1 = await user_factory(
-            "followed_guy1", "pass123", "cool.otter@aol.com"
+        emails = ["cool.otter@aol.com", "grizz.bear@aol.com", "happy.seal@aol.com"]
+        followed_users = [
+            make_user(f"followed_guy{i}", email)
+            for i, email in enumerate(emails, start=1)
+        ]
+        game = Game(title="Game 1", summary="Summary", igdb_id=1)
+
+        # Follow all 3 users and create a review from each in one commit
+        await bulk_seed(
+            game,
+            *followed_users,
+            *(
+                Follow(
+                    follower_id=test_user.id,
+                    followed=user,
+                    status=FollowStatus.ACCEPTED,
+                )
+                for user in followed_users
+            ),
+            *(
+                Review(
+                    game=game,
+                    user=user,
+                    rating=5.0,
+                    review_text=f"Review {i}",
+                    playtime=10,
+                )
+                for i, user in enumerate(followed_users, start=1)
+            ),
         )
-        await follow_request_factory(
-            test_user.id, followed_user1.id, FollowStatus.ACCEPTED
-        )
-        followed_user2 = await user_factory(
-            "followed_guy2", "pass123", "grizz.bear@aol.com"
-        )
-        await follow_request_factory(
-            test_user.id, followed_user2.id, FollowStatus.ACCEPTED
-        )
-
-        followed_user3 = await user_factory(
-            "followed_guy3", "pass123", "happy.seal@aol.com"
-        )
-        await follow_request_factory(
-            test_user.id, followed_user3.id, FollowStatus.ACCEPTED
-        )
-
-        game = await game_factory("Game 1", "Summary", 1)
-
-        # Create 3 reviews
-        await review_factory(game.id, followed_user1.id, 5.0, "Review 1", 10)
-        await review_factory(game.id, followed_user2.id, 5.0, "Review 2", 10)
-        await review_factory(game.id, followed_user3.id, 5.0, "Review 3", 10)
 
         # Test limit=2
         response = await authenticated_client.get("/feed/", params={"limit": 2})
@@ -112,15 +109,13 @@ class TestFeedEndpoints:
     async def test_feed_excludes_unfollowed_users(
         self,
         authenticated_client: AsyncClient,
-        user_factory,
-        game_factory,
-        review_factory,
+        factories,
     ):
         """Test that reviews from users NOT followed do not appear in feed."""
         # Create a user we do NOT follow
-        stranger = await user_factory("stranger", "pass123", "cool.otter@aol.com")
-        game = await game_factory("Secret Game", "Summary", 999)
-        await review_factory(game.id, stranger.id, 1.0, "Don't look at this", 5)
+        stranger = await factories.user("stranger", "pass123", "cool.otter@aol.com")
+        game = await factories.game("Secret Game", "Summary", 999)
+        await factories.review(game.id, stranger.id, 1.0, "Don't look at this", 5)
 
         response = await authenticated_client.get("/feed/")
 
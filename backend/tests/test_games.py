@@ -69,151 +69,53 @@ class TestGamesEndpoints:
         assert response.json() == []
 
     @pytest.mark.asyncio
-    async def test_get_games_success(
+    async def test_get_games_matrix(
         self,
         authenticated_client: AsyncClient,
-        game_factory,
-    ):
-        """Test that /games/ returns all games."""
-        # Create test games
-        game1 = await game_factory("Game 1", "Summary 1", 1001)
-        game2 = await game_factory("Game 2", "Summary 2", 1002)
-        game3 = await game_factory("Game 3", "Summary 3", 1003)
-
-        response = await authenticated_client.get("/games/")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 3
-        assert data[0]["title"] == game1.title
-        assert data[1]["title"] == game2.title
-        assert data[2]["title"] == game3.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_pagination_skip(
-        self,
-        authenticated_client: AsyncClient,
-        game_factory,
-    ):
-        """Test that /games/ pagination skip parameter works correctly."""
-        # Create test games
-        await game_factory("Game 1", "Summary 1", 2001)
-        await game_factory("Game 2", "Summary 2", 2002)
-        game = await game_factory("Game 3", "Summary 3", 2003)
-
-        # Skip first 2 games
-        response = await authenticated_client.get("/games?skip=2")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["title"] == game.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_pagination_limit(
-        self,
-        authenticated_client: AsyncClient,
-        game_factory,
-    ):
-        """Test that /games/ pagination limit parameter works correctly."""
-        # Create test games
-        game1 = await game_factory("Game 1", "Summary 1", 3001)
-        game2 = await game_factory("Game 2", "Summary 2", 3002)
-        await game_factory("Game 3", "Summary 3", 3003)
-
-        # Limit to 2 games
-        response = await authenticated_client.get("/games?limit=2")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 2
-        assert data[0]["title"] == game1.title
-        assert data[1]["title"] == game2.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_pagination_skip_and_limit(
-        self,
-        authenticated_client: AsyncClient,
-        game_factory,
-    ):
-        """Test that /games/ pagination with both skip and limit works correctly."""
-        # Create test games
-        await game_factory("Game 1", "Summary 1", 4001)
-        game2 = await game_factory("Game 2", "Summary 2", 4002)
-        game3 = await game_factory("Game 3", "Summary 3", 4003)
-        await game_factory("Game 4", "Summary 4", 4004)
-        await game_factory("Game 5", "Summary 5", 4005)
-
-        # Skip 1, limit to 2
-        response = await authenticated_client.get("/games?skip=1&limit=2")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 2
-        assert data[0]["title"] == game2.title
-        assert data[1]["title"] == game3.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_desc(
-        self,
-        authenticated_client: AsyncClient,
-        game_factory,
-    ):
-        """Test that /games/ with reverse order works correctly."""
-        # Create test games
-        game1 = await game_factory("Game 1", "Summary 1", 4001)
-        game2 = await game_factory("Game 2", "Summary 2", 4002)
-        game3 = await game_factory("Game 3", "Summary 3", 4003)
-
-        # Sort in reverse order
-        response = await authenticated_client.get("/games?sort_dir=desc")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 3
-        assert data[0]["title"] == game3.title
-        assert data[1]["title"] == game2.title
-        assert data[2]["title"] == game1.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_sort_by(
-        self,
-        authenticated_client: AsyncClient,
-        game_factory,
+        games_factory_bulk,
     ):
-        """Test that /games/ with sort_by works correctly."""
-        # Create test games
-        game1 = await game_factory("ZGame 1", "Summary 1", 4001)
-        game2 = await game_factory("AGame 2", "Summary 2", 4002)
-        game3 = await game_factory("MGame 3", "Summary 3", 4003)
-
-        # Sort by title in ascending order
-        response = await authenticated_client.get("/games?sort_by=title")
-        assert response.status_code == status.HTTP_200_OK
-
-        data = response.json()
-        assert len(data) == 3
-        assert data[0]["title"] == game2.title
-        assert data[1]["title"] == game3.title
-        assert data[2]["title"] == game1.title
-
-    @pytest.mark.asyncio
-    async def test_get_games_negative_skip(
+        """Test that /games/ pagination and sorting parameters work correctly."""
+        # Create test games once (title order differs from ID order)
+        game1, game2, game3, game4, game5 = await games_factory_bulk(
+            [
+                ("ZGame 1", "Summary 1", 1001),
+                ("AGame 2", "Summary 2", 1002),
+                ("MGame 3", "Summary 3", 1003),
+                ("QGame 4", "Summary 4", 1004),
+                ("CGame 5", "Summary 5", 1005),
+            ]
+        )
+        cases = [
+            # Return all games
+            ("", [game1, game2, game3, game4, game5]),
+            # Skip first 2 games
+            ("skip=2", [game3, game4, game5]),
+            # Limit to 2 games
+            ("limit=2", [game1, game2]),
+            # Skip 1, limit to 2
+            ("skip=1&limit=2", [game2, game3]),
+            # Sort in reverse order
+            ("sort_dir=desc", [game5, game4, game3, game2, game1]),
+            # Sort by title in ascending order
+            ("sort_by=title", [game2, game5, game3, game4, game1]),
+        ]
+
+        for query, expected_games in cases:
+            response = await authenticated_client.get(f"/games?{query}")
+            assert response.status_code == status.HTTP_200_OK, query
+
+            titles = [d["title"] for d in response.json()]
+            assert titles == [game.title for game in expected_games], query
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["skip=-1", "limit=-1"])
+    async def test_get_games_invalid_params(
         self,
         authenticated_client: AsyncClient,
+        query: str,
     ):
-        """Test that /games/ returns 400 with negative skip parameter."""
-        response = await authenticated_client.get("/games?skip=-1")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.json()["detail"] == "Invalid parameters"
-
-    @pytest.mark.asyncio
-    async def test_get_games_negative_limit(
-        self,
-        authenticated_client: AsyncClient,
-    ):
-        """Test that /games/ returns 400 with negative limit parameter."""
-        response = await authenticated_client.get("/games?limit=-1")
+        """Test that /games/ returns 400 with a negative skip or limit parameter."""
+        response = await authenticated_client.get(f"/games?{query}")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json()["detail"] == "Invalid parameters"
 
@@ -243,37 +145,36 @@ class TestGamesEndpoints:
         assert g1.title in titles
         assert g2.title in titles
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_discover_personalized_with_history(
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        game_factory,
-        review_factory,
-        user_factory,
+        factories,
     ):
         """
         Test that if User A is similar to User B, User A gets recommended
         games that User B liked.
         """
         # Setup Games
-        game_rpg = await game_factory("Skyrim", "RPG", 200)
-        game_fps = await game_factory("Doom", "FPS", 201)
-        game_target: Game = await game_factory(
+        game_rpg = await factories.game("Skyrim", "RPG", 200)
+        game_fps = await factories.game("Doom", "FPS", 201)
+        game_target: Game = await factories.game(
             "Witcher", "RPG", 202
         )  # User B likes this, User A hasn't seen it
 
         # Setup "Neighbor" User (User B)
-        user_b = await user_factory("rpg_lover", "password123", "cool.otter@aol.com")
+        user_b = await factories.user("rpg_lover", "password123", "cool.otter@aol.com")
 
         # Both Current User (A) and User B like Skyrim (High Rating)
         # This makes them "Neighbors" in the vector space
-        await review_factory(game_rpg.id, test_user.id, 10.0, "RPG", 360)
-        await review_factory(game_rpg.id, user_b.id, 10.0, "RPG 2", 420)
+        await factories.review(game_rpg.id, test_user.id, 10.0, "RPG", 360)
+        await factories.review(game_rpg.id, user_b.id, 10.0, "RPG 2", 420)
 
         # User B also loves Witcher, but User A hasn't played it yet.
         # The engine should now recommend Witcher to User A.
-        await review_factory(game_target.id, user_b.id, 9.0, "Henry Cavill?", 120)
+        await factories.review(game_target.id, user_b.id, 9.0, "Henry Cavill?", 120)
 
         # 5. Run Request
         response = await authenticated_client.get("/games/discover/personalized")
@@ -1,9 +1,25 @@
 import pytest
 from httpx import AsyncClient
 from fastapi import status
-from app.models import User, CommentResponse, UpdateCommentRequest
-from app.common_types import FollowStatus
+from app.models import User, Like, Comment, CommentResponse, UpdateCommentRequest
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel import func, select
+
+
+async def count_likes(session: AsyncSession, review_id: int) -> int:
+    """Count the likes on a review with a single aggregate query."""
+    result = await session.exec(
+        select(func.count()).select_from(Like).where(Like.review_id == review_id)
+    )
+    return result.one()
+
+
+async def count_comments(session: AsyncSession, review_id: int) -> int:
+    """Count the comments on a review with a single aggregate query."""
+    result = await session.exec(
+        select(func.count()).select_from(Comment).where(Comment.review_id == review_id)
+    )
+    return result.one()
 
 
 class TestInteractionsEndpoints:
@@ -15,204 +31,80 @@ class TestInteractionsEndpoints:
         authenticated_client: AsyncClient,
         test_session: AsyncSession,
         test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        follow_request_factory,
+        seeded_review,
     ):
         """Test that liking a review works."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        review = seeded_review.review
 
         response = await authenticated_client.post(f"/reviews/{review.id}/like")
         assert response.status_code == status.HTTP_201_CREATED
         assert response.json()["user_id"] == test_user.id
         assert response.json()["review_id"] == review.id
 
-        await test_session.refresh(review)
-        assert len(review.likes) == 1
-        assert review.likes[0].user_id == test_user.id
-        assert review.likes[0].review_id == review.id
+        assert await count_likes(test_session, review.id) == 1
 
     @pytest.mark.asyncio
-    async def test_like_review_not_found(
-        self,
-        authenticated_client: AsyncClient,
-        test_session: AsyncSession,
-        user_factory,
-        game_factory,
-        review_factory,
-    ):
-        """Test liking a review that doesn't exist."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-
-        response = await authenticated_client.post(f"/reviews/{review.id + 1}/like")
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
-        await test_session.refresh(review)
-        assert len(review.likes) == 0
-
-    @pytest.mark.asyncio
-    async def test_like_review_duplicate(
+    @pytest.mark.parametrize(
+        "method,review_offset,pre_like,expected_status,expected_count",
+        [
+            ("POST", 1, False, status.HTTP_404_NOT_FOUND, 0),
+            ("POST", 0, True, status.HTTP_400_BAD_REQUEST, 1),
+            ("DELETE", 0, True, status.HTTP_204_NO_CONTENT, 0),
+            ("DELETE", 1, False, status.HTTP_404_NOT_FOUND, 0),
+            ("DELETE", 0, False, status.HTTP_400_BAD_REQUEST, 0),
+        ],
+        ids=[
+            "like_not_found",
+            "like_duplicate",
+            "unlike",
+            "unlike_not_found",
+            "unlike_not_liked",
+        ],
+    )
+    async def test_like_endpoint(
         self,
         authenticated_client: AsyncClient,
         test_session: AsyncSession,
         test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
+        seeded_review,
         like_factory,
-        follow_request_factory,
-    ):
-        """Test that liking a review that has already been liked."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
-        # Create a test like
-        await like_factory(review.id, test_user.id)
-
-        response = await authenticated_client.post(f"/reviews/{review.id}/like")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        await test_session.refresh(review)
-        assert len(review.likes) == 1
-
-    @pytest.mark.asyncio
-    async def test_unlike_review(
-        self,
-        authenticated_client: AsyncClient,
-        test_session: AsyncSession,
-        test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        like_factory,
-        follow_request_factory,
-    ):
-        """Test unliking a review."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
-        # Create a test like
-        await like_factory(review.id, test_user.id)
-
-        # Test unliking a review
-        response = await authenticated_client.delete(f"/reviews/{review.id}/like")
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-
-        await test_session.refresh(review)
-        assert len(review.likes) == 0
-
-    @pytest.mark.asyncio
-    async def test_unlike_review_not_found(
-        self,
-        authenticated_client: AsyncClient,
-        test_session: AsyncSession,
-        user_factory,
-        game_factory,
-        review_factory,
+        method: str,
+        review_offset: int,
+        pre_like: bool,
+        expected_status: int,
+        expected_count: int,
     ):
-        """Test unliking a review that doesn't exist."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
+        """Test liking and unliking a review across missing/duplicate/unliked cases."""
+        review = seeded_review.review
+        if pre_like:
+            # Create a test like
+            await like_factory(review.id, test_user.id)
 
-        response = await authenticated_client.delete(f"/reviews/{review.id + 1}/like")
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
-        await test_session.refresh(review)
-        assert len(review.likes) == 0
-
-    @pytest.mark.asyncio
-    async def test_unlike_review_not_liked(
-        self,
-        authenticated_client: AsyncClient,
-        test_session: AsyncSession,
-        test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        follow_request_factory,
-    ):
-        """Test unliking a review that isn't liked."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
+        response = await authenticated_client.request(
+            method, f"/reviews/{review.id + review_offset}/like"
         )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
-
-        response = await authenticated_client.delete(f"/reviews/{review.id}/like")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == expected_status
 
-        await test_session.refresh(review)
-        assert len(review.likes) == 0
+        assert await count_likes(test_session, review.id) == expected_count
 
     @pytest.mark.asyncio
     async def test_get_likes(
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        like_factory,
-        follow_request_factory,
+        make_user,
+        seeded_review,
+        bulk_seed,
     ):
         """Test getting likes."""
-        # Create users
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        user3 = await user_factory("user3", "password123", "grizz.bear@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
+        review = seeded_review.review
+        # Create a third user and both likes in one commit
+        user3 = make_user("user3", "grizz.bear@aol.com")
+        await bulk_seed(
+            user3,
+            Like(review_id=review.id, user_id=test_user.id),
+            Like(review_id=review.id, user=user3),
         )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
-
-        # Create test likes
-        await like_factory(review.id, test_user.id)
-        await like_factory(review.id, user3.id)
 
         response = await authenticated_client.get(f"/reviews/{review.id}/likes")
         assert response.status_code == status.HTTP_200_OK
@@ -223,23 +115,10 @@ class TestInteractionsEndpoints:
         self,
         authenticated_client: AsyncClient,
         test_session: AsyncSession,
-        test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
-        follow_request_factory,
+        seeded_review,
     ):
         """Test creating a comment."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        review = seeded_review.review
 
         json_request = {
             "text": "Very cool game!",
@@ -249,35 +128,23 @@ class TestInteractionsEndpoints:
             f"/reviews/{review.id}/comments", json=json_request
         )
         assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["text"] == "Very cool game!"
 
-        await test_session.refresh(review)
-        assert len(review.comments) == 1
-        assert review.comments[0].text == "Very cool game!"
+        assert await count_comments(test_session, review.id) == 1
 
     @pytest.mark.asyncio
     async def test_get_review_comments(
         self,
         authenticated_client: AsyncClient,
         test_user: User,
+        seeded_review,
         user_factory,
-        game_factory,
-        review_factory,
         comment_factory,
-        follow_request_factory,
     ):
         """Test getting review comments."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
+        review = seeded_review.review
         # Create a third user to post a comment with
-        user3 = await user_factory("user3", "password123", "grizz.bear@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        user3 = await user_factory("user3", "password123")
 
         # Create dummy comments
         comment1 = await comment_factory(review.id, test_user.id, "Good review!", None)
@@ -303,23 +170,11 @@ class TestInteractionsEndpoints:
         authenticated_client: AsyncClient,
         test_user: User,
         test_session: AsyncSession,
-        user_factory,
-        game_factory,
-        review_factory,
+        seeded_review,
         comment_factory,
-        follow_request_factory,
     ):
         """Test updating a comment."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        review = seeded_review.review
 
         # Create dummy comments
         comment1 = await comment_factory(review.id, test_user.id, "Good review!", None)
@@ -333,7 +188,7 @@ class TestInteractionsEndpoints:
         assert response.status_code == status.HTTP_200_OK
 
         previous_updated_at = comment1.updated_at
-        await test_session.refresh(comment1)
+        await test_session.refresh(comment1, attribute_names=["text", "updated_at"])
 
         assert comment1.text == json_request["text"]
         assert comment1.updated_at != previous_updated_at
@@ -343,28 +198,15 @@ class TestInteractionsEndpoints:
     async def test_update_comment_unauthorized(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,
-        user_factory,
-        game_factory,
-        review_factory,
+        seeded_review,
         comment_factory,
-        follow_request_factory,
     ):
         """Test updating a comment with an unauthorized user."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        review = seeded_review.review
 
         # Create dummy comments
         comment1 = await comment_factory(
-            review.id, user2.id, "This is my review!", None
+            review.id, seeded_review.user2.id, "This is my review!", None
         )
 
         json_request = UpdateCommentRequest(
@@ -381,28 +223,15 @@ class TestInteractionsEndpoints:
         authenticated_client: AsyncClient,
         test_user: User,
         test_session: AsyncSession,
-        user_factory,
-        game_factory,
-        review_factory,
+        seeded_review,
         comment_factory,
-        follow_request_factory,
     ):
         """Test deleting a comment."""
-        # Create a second user to post a review with
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-        # Create a test game
-        game = await game_factory("Test Game", "A test game summary", 12345)
-        # Create a test review
-        review = await review_factory(
-            game.id, user2.id, rating=9.6, review_text="Cool game", playtime=120
-        )
-        # Add follower/following
-        await follow_request_factory(test_user.id, user2.id, FollowStatus.ACCEPTED)
+        review = seeded_review.review
         # Create dummy comments
         comment1 = await comment_factory(review.id, test_user.id, "Good review!", None)
 
         response = await authenticated_client.delete(f"/comments/{comment1.id}")
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-        await test_session.refresh(review)
-        assert len(review.comments) == 0
+        assert await count_comments(test_session, review.id) == 0
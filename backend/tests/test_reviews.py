@@ -64,7 +64,7 @@ class TestReviewsEndpoints:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json()["detail"] == "You already have a review for this game"
 
-        await test_session.refresh(test_user)
+        await test_session.refresh(test_user, attribute_names=["reviews"])
         assert len(test_user.reviews) == 1
         assert test_user.reviews[0].game_id == game.id
 
@@ -90,7 +90,7 @@ class TestReviewsEndpoints:
         assert response.json()["user_id"] == test_user.id
         assert response.json()["game_id"] == game.id
 
-        await test_session.refresh(test_user)
+        await test_session.refresh(test_user, attribute_names=["reviews"])
         assert len(test_user.reviews) == 1
         assert test_user.reviews[0].game_id == game.id
 
@@ -127,7 +127,7 @@ class TestReviewsEndpoints:
         response = await authenticated_client.post("/reviews", json=json_request)
         assert response.status_code == status.HTTP_200_OK
 
-        await test_session.refresh(test_user)
+        await test_session.refresh(test_user, attribute_names=["reviews"])
         assert len(test_user.reviews) == 2
         assert test_user.reviews[0].game_id == game1.id
         assert test_user.reviews[1].game_id == game2.id
@@ -151,7 +151,7 @@ class TestReviewsEndpoints:
         response = await authenticated_client.delete(f"/reviews/{review.id}")
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
-        await test_session.refresh(test_user)
+        await test_session.refresh(test_user, attribute_names=["reviews"])
         assert len(test_user.reviews) == 0
 
     @pytest.mark.asyncio
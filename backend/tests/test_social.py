@@ -2,11 +2,46 @@ import pytest
 from httpx import AsyncClient
 from fastapi import status
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import ScalarResult, lambda_stmt
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import select
 from app.models import User, Follow
 import app.common_types as types
 
 
+async def load_follows(session: AsyncSession, user: User) -> User:
+    """Reload only a user's follow relationships, raising on any other lazy load."""
+    result = await session.exec(
+        select(User)
+        .where(User.id == user.id)
+        .options(
+            selectinload(User.followers).raiseload("*"),
+            selectinload(User.following).raiseload("*"),
+            raiseload("*"),
+        )
+        # Overwrite the relationships already loaded on the identity-mapped user
+        .execution_options(populate_existing=True)
+    )
+    return result.one()
+
+
+async def find_follows(
+    session: AsyncSession, follower_id: int, followed_id: int
+) -> ScalarResult[Follow]:
+    """Select the follows between two users with a statement compiled once."""
+    # The IDs become bound parameters, so every call reuses the cached SQL
+    statement = lambda_stmt(
+        lambda: select(Follow).where(
+            Follow.follower_id == follower_id, Follow.followed_id == followed_id
+        )
+    )
+    # Overwrite any identity-mapped follow so the stored row is what's checked
+    result = await session.exec(
+        statement, execution_options={"populate_existing": True}
+    )
+    return result.scalars()
+
+
 class TestSocialEndpoints:
     """Test suite for /social endpoints."""
 
@@ -51,13 +86,13 @@ class TestSocialEndpoints:
         follows = result.all()
         assert len(follows) == 0, "There should be no follow records"
 
+    @pytest.mark.max_queries(15)
     @pytest.mark.asyncio
     async def test_send_follow_request_success(
         self,
         authenticated_client: AsyncClient,
         test_user: User,
         user_factory,
-        test_session: AsyncSession,
     ):
         """Test that a follow request is successfully created in the database."""
         # Create a second user to follow
@@ -67,20 +102,13 @@ class TestSocialEndpoints:
         response = await authenticated_client.post(f"/social/follow/{user2.id}")
         assert response.status_code == status.HTTP_200_OK
 
-        # Check that a Follow record was created with the correct status
-        result = await test_session.exec(
-            select(Follow).where(
-                Follow.follower_id == test_user.id, Follow.followed_id == user2.id
-            )
-        )
-        follow = result.one_or_none()
-
-        assert follow is not None, "Follow record should exist in database"
-        assert follow.follower_id == test_user.id
-        assert follow.followed_id == user2.id
-        assert follow.status == types.FollowStatus.PENDING
+        # The endpoint returns the created Follow record, so check it directly
+        follow = response.json()
+        assert follow["follower_id"] == test_user.id
+        assert follow["followed_id"] == user2.id
+        assert follow["status"] == types.FollowStatus.PENDING
 
-        assert follow.created_at is not None
+        assert follow["created_at"] is not None
 
     @pytest.mark.asyncio
     async def test_duplicate_follow_request(
@@ -103,28 +131,22 @@ class TestSocialEndpoints:
         assert response2.status_code == status.HTTP_400_BAD_REQUEST
 
         # Verify only one Follow record exists
-        result = await test_session.exec(
-            select(Follow).where(
-                Follow.follower_id == test_user.id, Follow.followed_id == user2.id
-            )
-        )
+        result = await find_follows(test_session, test_user.id, user2.id)
         follows = result.all()
         assert len(follows) == 1, "Should only have one follow record"
 
+    @pytest.mark.max_queries(18)
     @pytest.mark.asyncio
     async def test_approve_follow_request_success(
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        follow_request_factory,
+        follower_factory,
         test_session: AsyncSession,
     ):
         """Test that sending a duplicate follow request is handled properly."""
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-
-        # Insert a pending follow request into the DB
-        await follow_request_factory(user2.id, test_user.id)
+        # Insert user2 and their pending follow request into the DB
+        user2 = await follower_factory(test_user)
 
         # Approve follow request
         approve_response = await authenticated_client.post(
@@ -132,19 +154,12 @@ class TestSocialEndpoints:
         )
         assert approve_response.status_code == status.HTTP_200_OK
 
-        # Check that a Follow record was approved with the correct status
-        result = await test_session.exec(
-            select(Follow).where(
-                Follow.follower_id == user2.id, Follow.followed_id == test_user.id
-            )
-        )
-        follow = result.one_or_none()
-
-        assert follow is not None, "Follow record should exist in database"
-        assert follow.status == types.FollowStatus.ACCEPTED
-        assert follow.created_at is not None
+        # The endpoint returns the approved Follow record, so check it directly
+        follow = approve_response.json()
+        assert follow["status"] == types.FollowStatus.ACCEPTED
+        assert follow["created_at"] is not None
 
-        await test_session.refresh(test_user)
+        test_user = await load_follows(test_session, test_user)
 
         # Verify test_user's followers list includes user2
         assert len(test_user.followers) == 1
@@ -156,17 +171,12 @@ class TestSocialEndpoints:
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        follow_request_factory,
+        follower_factory,
         test_session: AsyncSession,
     ):
         """Test that sending a duplicate follow request is handled properly."""
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-
-        # Insert a follow request into the DB
-        await follow_request_factory(
-            user2.id, test_user.id, types.FollowStatus.ACCEPTED
-        )
+        # Insert user2 and their accepted follow request into the DB
+        user2 = await follower_factory(test_user, types.FollowStatus.ACCEPTED)
 
         # Approve follow request
         approve_response = await authenticated_client.post(
@@ -176,11 +186,7 @@ class TestSocialEndpoints:
         assert approve_response.json()["detail"] == "This follow request is not pending"
 
         # Check that a Follow record was approved with the correct status
-        result = await test_session.exec(
-            select(Follow).where(
-                Follow.follower_id == user2.id, Follow.followed_id == test_user.id
-            )
-        )
+        result = await find_follows(test_session, user2.id, test_user.id)
         follow = result.one_or_none()
 
         assert follow is not None, "Follow record should exist in database"
@@ -201,9 +207,9 @@ class TestSocialEndpoints:
         response = await authenticated_client.post(f"/social/follow/{user2.id}")
         assert response.status_code == status.HTTP_200_OK
 
-        # Refresh users to get updated relationships
-        await test_session.refresh(test_user)
-        await test_session.refresh(user2)
+        # Reload users to get updated relationships
+        test_user = await load_follows(test_session, test_user)
+        user2 = await load_follows(test_session, user2)
 
         # Verify test_user's following list includes user2
         assert len(test_user.following) == 1
@@ -221,16 +227,13 @@ class TestSocialEndpoints:
         self,
         authenticated_client: AsyncClient,
         test_user: User,
-        user_factory,
-        follow_request_factory,
+        follower_factory,
         test_session: AsyncSession,
         follow_status: types.FollowStatus,
     ):
         """Test rejecting a follow request."""
-        user2 = await user_factory("user2", "password123", "cool.otter@aol.com")
-
-        # Insert a pending follow request into the DB
-        await follow_request_factory(user2.id, test_user.id, follow_status)
+        # Insert user2 and their follow request into the DB
+        user2 = await follower_factory(test_user, follow_status)
 
         # Reject follow request
         approve_response = await authenticated_client.post(
@@ -238,9 +241,9 @@ class TestSocialEndpoints:
         )
         assert approve_response.status_code == status.HTTP_200_OK
 
-        # Refresh users to get updated relationships
-        await test_session.refresh(test_user)
-        await test_session.refresh(user2)
+        # Reload users to get updated relationships
+        test_user = await load_follows(test_session, test_user)
+        user2 = await load_follows(test_session, user2)
 
         assert len(user2.following) == 0
         assert len(test_user.followers) == 0
@@ -263,9 +266,9 @@ class TestSocialEndpoints:
         assert approve_response.status_code == status.HTTP_400_BAD_REQUEST
         assert approve_response.json()["detail"] == "This user does not follow you"
 
-        # Refresh users to get updated relationships
-        await test_session.refresh(test_user)
-        await test_session.refresh(user2)
+        # Reload users to get updated relationships
+        test_user = await load_follows(test_session, test_user)
+        user2 = await load_follows(test_session, user2)
 
         assert len(user2.following) == 0
         assert len(test_user.followers) == 0
@@ -1,7 +1,9 @@
 import pytest
+from datetime import datetime, timedelta
 from httpx import AsyncClient
 from fastapi import status
 from app.models import User
+from app.core.security import create_access_token
 
 
 class TestUsersEndpoints:
@@ -22,6 +24,31 @@ class TestUsersEndpoints:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.json()["detail"] == "Could not validate credentials"
 
+    @pytest.mark.asyncio
+    async def test_get_me_with_expired_cached_token(
+        self, client: AsyncClient, test_user: User, monkeypatch
+    ):
+        """Test that a cached token is rejected once it has expired."""
+        token = create_access_token(
+            data={"sub": test_user.username}, expires_delta=timedelta(minutes=1)
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # The first request decodes the token and caches its payload
+        response = await client.get("/users/me", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+        class ExpiredDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(minutes=2)
+
+        # Move the clock past the expiry; the payload now comes from the cache
+        monkeypatch.setattr("app.core.security.datetime", ExpiredDatetime)
+        response = await client.get("/users/me", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "Could not validate credentials"
+
     @pytest.mark.asyncio
     async def test_get_me_with_valid_auth(
         self, authenticated_client: AsyncClient, test_user: User
@@ -36,58 +63,22 @@ class TestUsersEndpoints:
         assert "hashed_password" not in data
 
     @pytest.mark.asyncio
-    async def test_multiple_users_isolation(self, client: AsyncClient):
+    async def test_multiple_users_isolation(
+        self, client: AsyncClient, logged_in_user_factory
+    ):
         """Test that multiple users are properly isolated."""
-        # Register first user
-        response1 = await client.post(
-            "/auth/register",
-            json={
-                "username": "user1",
-                "password": "password1",
-                "email": "cool.otter@aol.com",
-                "private": True,
-            },
-        )
-        assert response1.status_code == status.HTTP_200_OK
+        users = [
+            ("user1", "password1", "cool.otter@aol.com", True),
+            ("user2", "password2", "grizz.bear@aol.com", False),
+        ]
+        # Register and log in every user before checking any of them
+        tokens = [await logged_in_user_factory(*creds) for creds in users]
 
-        # Register second user
-        response2 = await client.post(
-            "/auth/register",
-            json={
-                "username": "user2",
-                "password": "password2",
-                "email": "grizz.bear@aol.com",
-                "private": False,
-            },
-        )
-        assert response2.status_code == status.HTTP_200_OK
-
-        # Login as user1
-        login1 = await client.post(
-            "/auth/login",
-            data={"username": "user1", "password": "password1"},
-        )
-        token1 = login1.json()["access_token"]
-
-        # Login as user2
-        login2 = await client.post(
-            "/auth/login",
-            data={"username": "user2", "password": "password2"},
-        )
-        token2 = login2.json()["access_token"]
-
-        # Verify user1 gets their own data
-        response = await client.get(
-            "/users/me",
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["username"] == "user1"
-
-        # Verify user2 gets their own data
-        response = await client.get(
-            "/users/me",
-            headers={"Authorization": f"Bearer {token2}"},
-        )
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["username"] == "user2"
+        # Verify each user gets their own data
+        for (username, *_), token in zip(users, tokens):
+            response = await client.get(
+                "/users/me",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["username"] == username